@@ -5,6 +5,12 @@ Provides a quick overview of the data analysis results
 
 from data_analyzer import DataAnalyzer
 import pandas as pd
+import numpy as np
+import sys
+
+def _strength(corr_val: float) -> str:
+    """Describe the strength of a correlation coefficient"""
+    return "Strong" if abs(corr_val) > 0.7 else "Moderate" if abs(corr_val) > 0.5 else "Weak"
 
 def print_key_findings():
     """Print key findings from the employee dataset analysis"""
@@ -19,81 +25,86 @@ def print_key_findings():
     print("\n📊 KEY STATISTICS:")
     print("-" * 30)
     
+    # Compute statistics for all numeric columns in one call
+    stats = analyzer.calculate_statistics()
+    
     # Salary analysis
-    salary_stats = analyzer.calculate_statistics('Salary')['Salary']
+    salary_stats = stats['Salary']
     print(f"💰 Average Salary: ${salary_stats['mean']:,.2f}")
     print(f"💰 Salary Range: ${salary_stats['min']:,.0f} - ${salary_stats['max']:,.0f}")
     print(f"💰 Salary Std Dev: ${salary_stats['std']:,.2f}")
     
     # Experience analysis
-    exp_stats = analyzer.calculate_statistics('Years_Experience')['Years_Experience']
+    exp_stats = stats['Years_Experience']
     print(f"📈 Average Experience: {exp_stats['mean']:.1f} years")
     print(f"📈 Experience Range: {exp_stats['min']:.0f} - {exp_stats['max']:.0f} years")
     
     # Age analysis
-    age_stats = analyzer.calculate_statistics('Age')['Age']
+    age_stats = stats['Age']
     print(f"👥 Average Age: {age_stats['mean']:.1f} years")
     print(f"👥 Age Range: {age_stats['min']:.0f} - {age_stats['max']:.0f} years")
     
     # Performance analysis
-    perf_stats = analyzer.calculate_statistics('Performance_Score')['Performance_Score']
+    perf_stats = stats['Performance_Score']
     print(f"⭐ Average Performance: {perf_stats['mean']:.2f}/10")
     print(f"⭐ Performance Range: {perf_stats['min']:.1f} - {perf_stats['max']:.1f}")
     
     print("\n🏢 DEPARTMENT BREAKDOWN:")
     print("-" * 30)
-    dept_counts = analyzer.df['Department'].value_counts()
-    for dept, count in dept_counts.items():
-        percentage = (count / len(analyzer.df)) * 100
-        print(f"{dept}: {count} employees ({percentage:.1f}%)")
+    # One grouped pass per categorical gives both the breakdowns and the averages below
+    dept_agg = analyzer.df.groupby('Department', observed=True).agg(
+        n=('Salary', 'size'), salary_count=('Salary', 'count'), avg_salary=('Salary', 'mean'))
+    edu_agg = analyzer.df.groupby('Education_Level', observed=True).agg(
+        n=('Performance_Score', 'size'), perf_count=('Performance_Score', 'count'),
+        avg_perf=('Performance_Score', 'mean'))
+    
+    dept_counts = dept_agg['n'].sort_values(ascending=False, kind='stable')
+    dept_pct = dept_counts.mul(100.0 / len(analyzer.df))
+    sys.stdout.write("".join(f"{dept}: {count} employees ({percentage:.1f}%)\n"
+                             for (dept, count), percentage in zip(dept_counts.items(), dept_pct.values)))
     
     print("\n🎓 EDUCATION BREAKDOWN:")
     print("-" * 30)
-    edu_counts = analyzer.df['Education_Level'].value_counts()
-    for edu, count in edu_counts.items():
-        percentage = (count / len(analyzer.df)) * 100
-        print(f"{edu}: {count} employees ({percentage:.1f}%)")
+    edu_counts = edu_agg['n'].sort_values(ascending=False, kind='stable')
+    edu_pct = edu_counts.mul(100.0 / len(analyzer.df))
+    sys.stdout.write("".join(f"{edu}: {count} employees ({percentage:.1f}%)\n"
+                             for (edu, count), percentage in zip(edu_counts.items(), edu_pct.values)))
     
     print("\n🔗 KEY CORRELATIONS:")
     print("-" * 30)
-    numeric_cols = analyzer.df.select_dtypes(include=['number']).columns
-    corr_matrix = analyzer.df[numeric_cols].corr()
+    corr_matrix = analyzer.corr_matrix()
     
-    # Find strongest correlations
-    correlations = []
-    for i in range(len(corr_matrix.columns)):
-        for j in range(i+1, len(corr_matrix.columns)):
-            corr_val = corr_matrix.iloc[i, j]
-            correlations.append((corr_matrix.columns[i], corr_matrix.columns[j], corr_val))
+    # Find strongest correlations in the upper triangle
+    values = corr_matrix.values
+    rows, cols = np.triu_indices(values.shape[0], k=1)
+    pair_values = values[rows, cols]
     
-    # Sort by absolute correlation value
-    correlations.sort(key=lambda x: abs(x[2]), reverse=True)
+    # Rank by absolute correlation value, keeping the top 3
+    order = np.argsort(-np.abs(pair_values), kind='stable')[:3]
+    names = corr_matrix.columns.values
     
-    for col1, col2, corr_val in correlations[:3]:  # Top 3 correlations
-        strength = "Strong" if abs(corr_val) > 0.7 else "Moderate" if abs(corr_val) > 0.5 else "Weak"
-        print(f"{col1} ↔ {col2}: {corr_val:.3f} ({strength})")
+    sys.stdout.write("".join(f"{col1} ↔ {col2}: {corr_val:.3f} ({_strength(corr_val)})\n"
+                             for col1, col2, corr_val in zip(names[rows[order]], names[cols[order]],
+                                                             pair_values[order])))
     
     print("\n💡 KEY INSIGHTS:")
     print("-" * 30)
     insights = analyzer.generate_insights()
-    for i, insight in enumerate(insights[:5], 1):  # Top 5 insights
-        print(f"{i}. {insight}")
+    sys.stdout.write("".join(f"{i}. {insight}\n" for i, insight in enumerate(insights[:5], 1)))  # Top 5 insights
     
     print("\n📈 SALARY ANALYSIS BY DEPARTMENT:")
     print("-" * 30)
-    dept_salary = analyzer.analyze_by_category('Salary', 'Department')
-    for dept in dept_salary['mean'].index:
-        avg_salary = dept_salary['mean'][dept]
-        count = dept_salary['count'][dept]
-        print(f"{dept}: ${avg_salary:,.0f} average ({count} employees)")
+    sys.stdout.write("".join(f"{dept}: ${avg_salary:,.0f} average ({count} employees)\n"
+                             for dept, avg_salary, count in zip(dept_agg.index,
+                                                                dept_agg['avg_salary'].values,
+                                                                dept_agg['salary_count'].values)))
     
     print("\n🎯 PERFORMANCE BY EDUCATION:")
     print("-" * 30)
-    edu_perf = analyzer.analyze_by_category('Performance_Score', 'Education_Level')
-    for edu in edu_perf['mean'].index:
-        avg_perf = edu_perf['mean'][edu]
-        count = edu_perf['count'][edu]
-        print(f"{edu}: {avg_perf:.2f}/10 average ({count} employees)")
+    sys.stdout.write("".join(f"{edu}: {avg_perf:.2f}/10 average ({count} employees)\n"
+                             for edu, avg_perf, count in zip(edu_agg.index,
+                                                             edu_agg['avg_perf'].values,
+                                                             edu_agg['perf_count'].values)))
     
     print("\n" + "="*60)
     print("✅ ANALYSIS COMPLETE")
@@ -3,6 +3,12 @@ Data Analysis Tool using Pandas and Matplotlib
 Performs comprehensive data analysis and creates visualizations
 """
 
+import contextlib
+import copy
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -11,6 +17,71 @@ from typing import Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow as pa  # optional, enables the Parquet load cache
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Parquet schema metadata key recording which CSV version a cache file was built from
+_CACHE_SOURCE_KEY = b'data_analyzer.source_csv'
+
+# Per-column block printed by DataAnalyzer.display_statistics
+_STATS_TEMPLATE = (
+    "\n📊 Statistics for '{column}':\n"
+    "  Count:      {count:>10.0f}\n"
+    "  Mean:       {mean:>10.2f}\n"
+    "  Median:     {median:>10.2f}\n"
+    "  Std Dev:    {std:>10.2f}\n"
+    "  Min:        {min:>10.2f}\n"
+    "  Max:        {max:>10.2f}\n"
+    "  Q1 (25%):   {q25:>10.2f}\n"
+    "  Q3 (75%):   {q75:>10.2f}\n"
+    "  Range:      {range:>10.2f}\n"
+    "  Variance:   {variance:>10.2f}\n"
+    "  Skewness:   {skewness:>10.2f}\n"
+    "  Kurtosis:   {kurtosis:>10.2f}\n"
+)
+
+
+def _fast_corrcoef(values: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation matrix of the columns of a 2D array without NaNs
+    
+    Standardizes each column once and computes all pairs with a single
+    matrix product instead of one pass per column pair.
+    """
+    centered = values - values.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normed = centered / np.sqrt((centered ** 2).sum(axis=0))
+    return np.clip(normed.T @ normed, -1.0, 1.0)
+
+
+# Analyzer shared by every chart job in a worker process, set by _init_chart_worker
+_worker_analyzer = None
+
+
+def _init_chart_worker(analyzer: 'DataAnalyzer') -> None:
+    """Receive the analyzer once per worker process and switch to a GUI-less backend"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+    plt.switch_backend('Agg')
+
+
+def _render_chart(method_name: str, args: tuple, kwargs: dict) -> str:
+    """
+    Run a chart method on the worker's analyzer
+    
+    Returns:
+        Text the chart method printed, so the caller can replay it in order
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        getattr(_worker_analyzer, method_name)(*args, **kwargs)
+    return output.getvalue()
+
+
 class DataAnalyzer:
     """Main class for data analysis and visualization"""
     
@@ -25,10 +96,41 @@ class DataAnalyzer:
         self.df = None
         self.load_data()
         
+        # Column selections are fixed once the data is loaded
+        self._numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        self._categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns.tolist()
+        self._numeric_set = frozenset(self._numeric_cols)
+        self._corr = None
+        self._hist_cache = {}
+        self._insights = None
+        
+        # Per-column metadata, gathered in one place since columns don't change after load
+        self._null_counts = self.df.isnull().sum()
+        self._basic_info = {
+            'shape': self.df.shape,
+            'columns': list(self.df.columns),
+            'data_types': self.df.dtypes.to_dict(),
+            'missing_values': self._null_counts.to_dict(),
+            'memory_usage': self.df.memory_usage(deep=True).sum(),
+            'numeric_columns': list(self._numeric_cols),
+            'categorical_columns': list(self._categorical_cols)
+        }
+        
+    @property
+    def numeric_columns(self) -> Tuple[str, ...]:
+        """Names of the numeric columns"""
+        return tuple(self._numeric_cols)
+    
+    @property
+    def categorical_columns(self) -> Tuple[str, ...]:
+        """Names of the categorical (text or category dtype) columns"""
+        return tuple(self._categorical_cols)
+    
     def load_data(self) -> None:
         """Load data from CSV file"""
         try:
-            self.df = pd.read_csv(self.csv_file_path)
+            self.df = self._read_csv_cached()
+            self._optimize_dtypes()
             print(f"✅ Data loaded successfully from {self.csv_file_path}")
             print(f"Dataset shape: {self.df.shape}")
         except FileNotFoundError:
@@ -38,49 +140,100 @@ class DataAnalyzer:
             print(f"❌ Error loading data: {str(e)}")
             raise
     
+    def _read_csv_cached(self) -> pd.DataFrame:
+        """
+        Read the CSV file, reusing a Parquet copy saved next to it on earlier runs
+        
+        The copy is stored as a hidden ``.<file>.csv.cache.parquet`` file so it can't
+        clash with the user's own files. It records the CSV's size and modification
+        time (in nanoseconds) and is only used when both still match exactly.
+        Caching requires pyarrow; without it the CSV is always parsed.
+        """
+        csv_stat = os.stat(self.csv_file_path)
+        if not _HAS_PYARROW:
+            return pd.read_csv(self.csv_file_path)
+        
+        directory, filename = os.path.split(self.csv_file_path)
+        cache_path = os.path.join(directory, f".{filename}.cache.parquet")
+        source = f"{csv_stat.st_size}:{csv_stat.st_mtime_ns}".encode()
+        
+        if os.path.exists(cache_path):
+            try:
+                metadata = pq.read_schema(cache_path).metadata or {}
+                if metadata.get(_CACHE_SOURCE_KEY) == source:
+                    return pd.read_parquet(cache_path, engine='pyarrow', memory_map=True)
+            except (OSError, ValueError, pa.ArrowException) as e:
+                print(f"⚠️  Could not read cache {cache_path} ({e}), reading CSV instead")
+        
+        df = pd.read_csv(self.csv_file_path)
+        try:
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                                   _CACHE_SOURCE_KEY: source})
+            pq.write_table(table, cache_path, compression='zstd')
+        except (OSError, ValueError, pa.ArrowException) as e:
+            print(f"⚠️  Could not write cache {cache_path} ({e})")
+        return df
+    
+    def _optimize_dtypes(self) -> None:
+        """
+        Convert low-cardinality text columns to categoricals after loading
+        
+        Numeric columns keep their loaded dtypes (int64/float64): downcasting them
+        would make arithmetic on the public ``df`` overflow or lose precision.
+        """
+        if self.df.empty:
+            return
+        
+        for col in self.df.select_dtypes(include=['object']).columns:
+            if self.df[col].nunique() / len(self.df) < 0.5:
+                self.df[col] = self.df[col].astype('category')
+    
     def basic_info(self) -> Dict:
         """Get basic information about the dataset"""
         if self.df is None:
             return {}
         
-        info = {
-            'shape': self.df.shape,
-            'columns': list(self.df.columns),
-            'data_types': dict(self.df.dtypes),
-            'missing_values': dict(self.df.isnull().sum()),
-            'memory_usage': self.df.memory_usage(deep=True).sum(),
-            'numeric_columns': list(self.df.select_dtypes(include=[np.number]).columns),
-            'categorical_columns': list(self.df.select_dtypes(include=['object']).columns)
-        }
-        
-        return info
+        # Deep copy so callers can't modify the cached record or its nested containers
+        return copy.deepcopy(self._basic_info)
+    
+    def corr_matrix(self) -> pd.DataFrame:
+        """Get the correlation matrix of all numeric columns (computed once)"""
+        if self._corr is None:
+            cols = self._numeric_cols
+            values = self.df[cols].to_numpy(dtype=np.float64)
+            if np.isnan(values).any():
+                # Fall back to pandas for pairwise handling of missing values
+                self._corr = self.df[cols].corr()
+            else:
+                self._corr = pd.DataFrame(_fast_corrcoef(values), index=cols, columns=cols)
+        return self._corr
     
     def display_basic_info(self) -> None:
         """Display basic information about the dataset"""
-        print("\n" + "="*60)
-        print("📊 DATASET OVERVIEW")
-        print("="*60)
-        
         info = self.basic_info()
         
-        print(f"📏 Shape: {info['shape'][0]} rows × {info['shape'][1]} columns")
-        print(f"💾 Memory Usage: {info['memory_usage'] / 1024:.2f} KB")
-        
-        print(f"\n📋 Columns ({len(info['columns'])}):")
-        for i, col in enumerate(info['columns'], 1):
-            dtype = info['data_types'][col]
-            missing = info['missing_values'][col]
-            print(f"  {i:2d}. {col:<20} ({dtype}) - Missing: {missing}")
-        
-        print(f"\n🔢 Numeric Columns ({len(info['numeric_columns'])}):")
-        print("  " + ", ".join(info['numeric_columns']))
-        
-        print(f"\n📝 Categorical Columns ({len(info['categorical_columns'])}):")
-        print("  " + ", ".join(info['categorical_columns']))
-        
-        # Display first few rows
-        print(f"\n📋 First 5 rows:")
-        print(self.df.head().to_string())
+        lines = [
+            "\n" + "="*60,
+            "📊 DATASET OVERVIEW",
+            "="*60,
+            f"📏 Shape: {info['shape'][0]} rows × {info['shape'][1]} columns",
+            f"💾 Memory Usage: {info['memory_usage'] / 1024:.2f} KB",
+            f"\n📋 Columns ({len(info['columns'])}):"
+        ]
+        lines += [f"  {i:2d}. {col:<20} ({info['data_types'][col]}) - Missing: {info['missing_values'][col]}"
+                  for i, col in enumerate(info['columns'], 1)]
+        lines += [
+            f"\n🔢 Numeric Columns ({len(info['numeric_columns'])}):",
+            "  " + ", ".join(info['numeric_columns']),
+            f"\n📝 Categorical Columns ({len(info['categorical_columns'])}):",
+            "  " + ", ".join(info['categorical_columns']),
+            # Display first few rows
+            f"\n📋 First 5 rows:",
+            self.df.head().to_string()
+        ]
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def calculate_statistics(self, column: str = None) -> Dict:
         """
@@ -95,9 +248,9 @@ class DataAnalyzer:
         if self.df is None:
             return {}
         
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        numeric_cols = self._numeric_cols
         
-        if column and column not in numeric_cols:
+        if column and column not in self._numeric_set:
             print(f"❌ Column '{column}' is not numeric or doesn't exist")
             return {}
         
@@ -106,49 +259,72 @@ class DataAnalyzer:
         else:
             cols_to_analyze = numeric_cols
         
+        if not cols_to_analyze:
+            return {}
+        
+        # One describe() pass plus one agg() pass instead of per-column reductions
+        desc = self.df[cols_to_analyze].describe().T
+        extra = self.df[cols_to_analyze].agg(['var', 'skew', 'kurtosis']).T
+        
         stats = {}
         for col in cols_to_analyze:
+            d = desc.loc[col]
+            e = extra.loc[col]
+            # describe() returns floats; give min/max back the column's own scalar type
+            col_type = self.df[col].dtype.type
+            col_min = d['min'] if pd.isna(d['min']) else col_type(d['min'])
+            col_max = d['max'] if pd.isna(d['max']) else col_type(d['max'])
             stats[col] = {
-                'count': self.df[col].count(),
-                'mean': self.df[col].mean(),
-                'median': self.df[col].median(),
-                'std': self.df[col].std(),
-                'min': self.df[col].min(),
-                'max': self.df[col].max(),
-                'q25': self.df[col].quantile(0.25),
-                'q75': self.df[col].quantile(0.75),
-                'range': self.df[col].max() - self.df[col].min(),
-                'variance': self.df[col].var(),
-                'skewness': self.df[col].skew(),
-                'kurtosis': self.df[col].kurtosis()
+                'count': np.int64(d['count']),
+                'mean': d['mean'],
+                'median': d['50%'],
+                'std': d['std'],
+                'min': col_min,
+                'max': col_max,
+                'q25': d['25%'],
+                'q75': d['75%'],
+                'range': col_max - col_min,
+                'variance': e['var'],
+                'skewness': e['skew'],
+                'kurtosis': e['kurtosis']
             }
         
         return stats
     
     def display_statistics(self, column: str = None) -> None:
         """Display statistics for numeric columns"""
-        print("\n" + "="*60)
-        print("📈 STATISTICAL ANALYSIS")
-        print("="*60)
+        sys.stdout.write("\n" + "="*60 + "\n📈 STATISTICAL ANALYSIS\n" + "="*60 + "\n")
         
         stats = self.calculate_statistics(column)
         
-        for col, col_stats in stats.items():
-            print(f"\n📊 Statistics for '{col}':")
-            print(f"  Count:      {col_stats['count']:>10.0f}")
-            print(f"  Mean:       {col_stats['mean']:>10.2f}")
-            print(f"  Median:     {col_stats['median']:>10.2f}")
-            print(f"  Std Dev:    {col_stats['std']:>10.2f}")
-            print(f"  Min:        {col_stats['min']:>10.2f}")
-            print(f"  Max:        {col_stats['max']:>10.2f}")
-            print(f"  Q1 (25%):   {col_stats['q25']:>10.2f}")
-            print(f"  Q3 (75%):   {col_stats['q75']:>10.2f}")
-            print(f"  Range:      {col_stats['range']:>10.2f}")
-            print(f"  Variance:   {col_stats['variance']:>10.2f}")
-            print(f"  Skewness:   {col_stats['skewness']:>10.2f}")
-            print(f"  Kurtosis:   {col_stats['kurtosis']:>10.2f}")
+        blocks = [_STATS_TEMPLATE.format_map({'column': col, **col_stats})
+                  for col, col_stats in stats.items()]
+        sys.stdout.write("".join(blocks))
+    
+    def _finish_plot(self, fig, save_path: Optional[str], label: str,
+                     show: Optional[bool] = None) -> None:
+        """
+        Save and/or display a finished figure, then release it
+        
+        Args:
+            fig: Figure to finish
+            save_path: Path to save the figure (optional)
+            label: Chart name used in the save message
+            show: Whether to display the figure (defaults to only when not saving)
+        """
+        if save_path:
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
+            print(f"📊 {label} saved to {save_path}")
+        
+        if show is None:
+            show = save_path is None
+        if show:
+            plt.show()
+        
+        plt.close(fig)
     
-    def create_bar_chart(self, column: str, title: str = None, save_path: str = None) -> None:
+    def create_bar_chart(self, column: str, title: str = None, save_path: str = None,
+                        show: Optional[bool] = None) -> None:
         """
         Create a bar chart for categorical data
         
@@ -156,12 +332,13 @@ class DataAnalyzer:
             column: Column name for the bar chart
             title: Custom title for the chart
             save_path: Path to save the chart (optional)
+            show: Whether to display the chart (defaults to only when not saving)
         """
         if self.df is None or column not in self.df.columns:
             print(f"❌ Column '{column}' not found")
             return
         
-        plt.figure(figsize=(12, 6))
+        fig = plt.figure(figsize=(12, 6))
         
         # Count values and create bar chart
         value_counts = self.df[column].value_counts()
@@ -182,15 +359,11 @@ class DataAnalyzer:
         plt.grid(axis='y', alpha=0.3)
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"📊 Bar chart saved to {save_path}")
-        
-        plt.show()
+        self._finish_plot(fig, save_path, "Bar chart", show)
     
     def create_scatter_plot(self, x_column: str, y_column: str, 
                           color_column: str = None, title: str = None, 
-                          save_path: str = None) -> None:
+                          save_path: str = None, show: Optional[bool] = None) -> None:
         """
         Create a scatter plot
         
@@ -200,6 +373,7 @@ class DataAnalyzer:
             color_column: Column for color coding (optional)
             title: Custom title for the chart
             save_path: Path to save the chart (optional)
+            show: Whether to display the chart (defaults to only when not saving)
         """
         if self.df is None:
             print("❌ No data loaded")
@@ -210,19 +384,21 @@ class DataAnalyzer:
             print(f"❌ Columns not found: {missing_cols}")
             return
         
-        plt.figure(figsize=(10, 8))
+        fig = plt.figure(figsize=(10, 8))
         
         if color_column and color_column in self.df.columns:
-            # Color-coded scatter plot
-            unique_values = self.df[color_column].unique()
-            colors = plt.cm.Set3(np.linspace(0, 1, len(unique_values)))
+            # Color-coded scatter plot, drawn in one call using category codes
+            categories = pd.Categorical(self.df[color_column])
+            codes = categories.codes
+            valid = codes >= 0  # Skip rows with a missing category
             
-            for i, value in enumerate(unique_values):
-                mask = self.df[color_column] == value
-                plt.scatter(self.df.loc[mask, x_column], self.df.loc[mask, y_column],
-                          c=[colors[i]], label=str(value), alpha=0.7, s=60)
+            scatter = plt.scatter(self.df[x_column].values[valid], self.df[y_column].values[valid],
+                                  c=codes[valid], cmap='Set3', alpha=0.7, s=60)
             
-            plt.legend(title=color_column.replace('_', ' ').title(), bbox_to_anchor=(1.05, 1), loc='upper left')
+            handles, _ = scatter.legend_elements(num=None)
+            labels = [str(value) for value in categories.categories[np.unique(codes[valid])]]
+            plt.legend(handles, labels, title=color_column.replace('_', ' ').title(),
+                       bbox_to_anchor=(1.05, 1), loc='upper left')
         else:
             # Simple scatter plot
             plt.scatter(self.df[x_column], self.df[y_column], 
@@ -234,9 +410,8 @@ class DataAnalyzer:
                  fontsize=14, fontweight='bold')
         
         # Add correlation coefficient if both columns are numeric
-        if (self.df[x_column].dtype in ['int64', 'float64'] and 
-            self.df[y_column].dtype in ['int64', 'float64']):
-            correlation = self.df[x_column].corr(self.df[y_column])
+        if x_column in self._numeric_set and y_column in self._numeric_set:
+            correlation = self.corr_matrix().at[x_column, y_column]
             plt.text(0.05, 0.95, f'Correlation: {correlation:.3f}', 
                     transform=plt.gca().transAxes, fontsize=12, 
                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
@@ -244,14 +419,10 @@ class DataAnalyzer:
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"📊 Scatter plot saved to {save_path}")
-        
-        plt.show()
+        self._finish_plot(fig, save_path, "Scatter plot", show)
     
     def create_heatmap(self, columns: List[str] = None, title: str = None, 
-                      save_path: str = None) -> None:
+                      save_path: str = None, show: Optional[bool] = None) -> None:
         """
         Create a correlation heatmap
         
@@ -259,17 +430,18 @@ class DataAnalyzer:
             columns: List of columns to include (optional, defaults to all numeric)
             title: Custom title for the chart
             save_path: Path to save the chart (optional)
+            show: Whether to display the chart (defaults to only when not saving)
         """
         if self.df is None:
             print("❌ No data loaded")
             return
         
         # Get numeric columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = self._numeric_cols
         
         if columns:
             # Filter to requested columns that are numeric
-            columns = [col for col in columns if col in numeric_cols]
+            columns = [col for col in columns if col in self._numeric_set]
             if not columns:
                 print("❌ No valid numeric columns specified")
                 return
@@ -280,10 +452,10 @@ class DataAnalyzer:
             print("❌ Need at least 2 numeric columns for correlation heatmap")
             return
         
-        # Calculate correlation matrix
-        correlation_matrix = self.df[columns].corr()
+        # Select from the cached correlation matrix
+        correlation_matrix = self.corr_matrix().loc[columns, columns]
         
-        plt.figure(figsize=(10, 8))
+        fig = plt.figure(figsize=(10, 8))
         
         # Create heatmap
         sns.heatmap(correlation_matrix, 
@@ -299,14 +471,10 @@ class DataAnalyzer:
         plt.yticks(rotation=0)
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"📊 Heatmap saved to {save_path}")
-        
-        plt.show()
+        self._finish_plot(fig, save_path, "Heatmap", show)
     
     def create_histogram(self, column: str, bins: int = 20, title: str = None, 
-                        save_path: str = None) -> None:
+                        save_path: str = None, show: Optional[bool] = None) -> None:
         """
         Create a histogram for numeric data
         
@@ -315,25 +483,31 @@ class DataAnalyzer:
             bins: Number of bins
             title: Custom title for the chart
             save_path: Path to save the chart (optional)
+            show: Whether to display the chart (defaults to only when not saving)
         """
         if self.df is None or column not in self.df.columns:
             print(f"❌ Column '{column}' not found")
             return
         
-        if self.df[column].dtype not in ['int64', 'float64']:
+        if column not in self._numeric_set:
             print(f"❌ Column '{column}' is not numeric")
             return
         
-        plt.figure(figsize=(10, 6))
+        fig = plt.figure(figsize=(10, 6))
+        
+        # Bin the values with NumPy, reusing earlier results for the same column and bins
+        key = (column, bins if np.ndim(bins) == 0 else tuple(bins))
+        if key not in self._hist_cache:
+            values = self.df[column].dropna().to_numpy()
+            counts, bin_edges = np.histogram(values, bins=bins)
+            self._hist_cache[key] = (counts, bin_edges, values.mean(), np.median(values))
+        counts, bin_edges, mean_val, median_val = self._hist_cache[key]
         
         # Create histogram
-        n, bins_edges, patches = plt.hist(self.df[column], bins=bins, 
-                                         color='lightblue', edgecolor='navy', 
-                                         alpha=0.7)
+        plt.bar(bin_edges[:-1], counts, width=np.diff(bin_edges), align='edge',
+                color='lightblue', edgecolor='navy', alpha=0.7)
         
         # Add statistics
-        mean_val = self.df[column].mean()
-        median_val = self.df[column].median()
         
         plt.axvline(mean_val, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.2f}')
         plt.axvline(median_val, color='green', linestyle='--', linewidth=2, label=f'Median: {median_val:.2f}')
@@ -346,11 +520,7 @@ class DataAnalyzer:
         plt.grid(axis='y', alpha=0.3)
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"📊 Histogram saved to {save_path}")
-        
-        plt.show()
+        self._finish_plot(fig, save_path, "Histogram", show)
     
     def analyze_by_category(self, numeric_column: str, category_column: str) -> Dict:
         """
@@ -370,20 +540,18 @@ class DataAnalyzer:
             print("❌ One or both columns not found")
             return {}
         
-        grouped = self.df.groupby(category_column)[numeric_column]
+        # Compute all group reductions in a single aggregation call.
+        # observed=True keeps categorical groupers from materializing every
+        # unused category combination, which can blow up time and memory.
+        grouped = self.df.groupby(category_column, observed=True)[numeric_column].agg(
+            ['count', 'mean', 'median', 'std', 'min', 'max'])
         
-        analysis = {
-            'count': grouped.count(),
-            'mean': grouped.mean(),
-            'median': grouped.median(),
-            'std': grouped.std(),
-            'min': grouped.min(),
-            'max': grouped.max()
-        }
+        analysis = {name: grouped[name] for name in grouped.columns}
         
         return analysis
     
-    def display_category_analysis(self, numeric_column: str, category_column: str) -> None:
+    def display_category_analysis(self, numeric_column: str, category_column: str,
+                                  show: Optional[bool] = None) -> None:
         """Display analysis by category"""
         print(f"\n" + "="*60)
         print(f"📊 ANALYSIS OF {numeric_column.upper()} BY {category_column.upper()}")
@@ -399,30 +567,36 @@ class DataAnalyzer:
         print(summary_df.round(2).to_string())
         
         # Create box plot
-        plt.figure(figsize=(12, 6))
+        fig = plt.figure(figsize=(12, 6))
         self.df.boxplot(column=numeric_column, by=category_column, ax=plt.gca())
         plt.title(f'{numeric_column.replace("_", " ").title()} by {category_column.replace("_", " ").title()}')
         plt.suptitle('')  # Remove default title
         plt.xticks(rotation=45)
         plt.tight_layout()
-        plt.show()
+        self._finish_plot(fig, None, "Box plot", show)
     
     def generate_insights(self) -> List[str]:
-        """Generate insights based on the data analysis"""
+        """Generate insights based on the data analysis (computed once)"""
         if self.df is None:
             return []
         
+        if self._insights is None:
+            self._insights = self._compute_insights()
+        return list(self._insights)
+    
+    def _compute_insights(self) -> List[str]:
+        """Build the list of insights from the loaded data"""
         insights = []
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        categorical_cols = self.df.select_dtypes(include=['object']).columns
+        numeric_cols = self._numeric_cols
+        categorical_cols = self._categorical_cols
         
         # Dataset overview insights
         insights.append(f"📊 Dataset contains {self.df.shape[0]} records with {self.df.shape[1]} features")
         
         # Missing data insights
-        missing_data = self.df.isnull().sum()
-        if missing_data.sum() > 0:
-            insights.append(f"⚠️  Found missing values in {(missing_data > 0).sum()} columns")
+        cols_with_missing = int((self._null_counts > 0).sum())
+        if cols_with_missing > 0:
+            insights.append(f"⚠️  Found missing values in {cols_with_missing} columns")
         else:
             insights.append("✅ No missing values detected in the dataset")
         
@@ -430,57 +604,57 @@ class DataAnalyzer:
         if len(numeric_cols) > 0:
             insights.append(f"🔢 Dataset has {len(numeric_cols)} numeric columns for quantitative analysis")
             
-            # Find columns with high variance
-            for col in numeric_cols:
-                cv = self.df[col].std() / self.df[col].mean() if self.df[col].mean() != 0 else 0
-                if cv > 0.5:
-                    insights.append(f"📈 {col} shows high variability (CV: {cv:.2f})")
+            # Find columns with high variance, reducing all numeric columns at once
+            values = self.df[numeric_cols].to_numpy(dtype=np.float64)
+            means = np.nanmean(values, axis=0)
+            stds = np.nanstd(values, axis=0, ddof=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cvs = np.where(means != 0, stds / means, 0.0)
+            
+            for i in np.nonzero(cvs > 0.5)[0]:
+                insights.append(f"📈 {numeric_cols[i]} shows high variability (CV: {cvs[i]:.2f})")
         
         # Categorical columns insights
         if len(categorical_cols) > 0:
             insights.append(f"📝 Dataset has {len(categorical_cols)} categorical columns")
             
-            for col in categorical_cols:
-                unique_count = self.df[col].nunique()
+            unique_counts = self.df[categorical_cols].nunique()
+            for col, unique_count in unique_counts.items():
                 if unique_count < 10:
                     insights.append(f"🏷️  {col} has {unique_count} unique categories")
         
         # Correlation insights
         if len(numeric_cols) >= 2:
-            corr_matrix = self.df[numeric_cols].corr()
-            # Find strong correlations (excluding diagonal)
-            strong_corrs = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        strong_corrs.append((corr_matrix.columns[i], corr_matrix.columns[j], corr_val))
+            corr_matrix = self.corr_matrix()
+            # Find strong correlations in the upper triangle (excluding diagonal)
+            values = corr_matrix.values
+            rows, cols = np.triu_indices(values.shape[0], k=1)
+            pair_values = values[rows, cols]
+            strong = np.abs(pair_values) > 0.7
+            names = corr_matrix.columns.values
             
-            if strong_corrs:
-                for col1, col2, corr_val in strong_corrs:
-                    insights.append(f"🔗 Strong correlation between {col1} and {col2}: {corr_val:.3f}")
+            for col1, col2, corr_val in zip(names[rows[strong]], names[cols[strong]], pair_values[strong]):
+                insights.append(f"🔗 Strong correlation between {col1} and {col2}: {corr_val:.3f}")
         
         return insights
     
     def display_insights(self) -> None:
         """Display generated insights"""
-        print("\n" + "="*60)
-        print("💡 DATA INSIGHTS & OBSERVATIONS")
-        print("="*60)
-        
         insights = self.generate_insights()
         
-        for i, insight in enumerate(insights, 1):
-            print(f"{i:2d}. {insight}")
+        lines = ["\n" + "="*60, "💡 DATA INSIGHTS & OBSERVATIONS", "="*60]
+        lines += [f"{i:2d}. {insight}" for i, insight in enumerate(insights, 1)]
+        lines.append("\n" + "="*60)
         
-        print("\n" + "="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def comprehensive_analysis(self, save_plots: bool = False) -> None:
+    def comprehensive_analysis(self, save_plots: bool = False, show: Optional[bool] = None) -> None:
         """
         Perform comprehensive analysis of the dataset
         
         Args:
             save_plots: Whether to save plots to files
+            show: Whether to display plots (defaults to only when not saving)
         """
         print("🚀 Starting Comprehensive Data Analysis...")
         
@@ -491,38 +665,55 @@ class DataAnalyzer:
         self.display_statistics()
         
         # Get numeric and categorical columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = self.df.select_dtypes(include=['object']).columns.tolist()
+        numeric_cols = self._numeric_cols
+        categorical_cols = self._categorical_cols
         
         # Create visualizations
         print(f"\n📊 Creating visualizations...")
         
+        # Collect chart jobs as (method name, args, kwargs)
+        charts = []
+        
         # Bar charts for categorical data
         for col in categorical_cols[:2]:  # Limit to first 2 categorical columns
             save_path = f"bar_chart_{col}.png" if save_plots else None
-            self.create_bar_chart(col, save_path=save_path)
+            charts.append(('create_bar_chart', (col,), {'save_path': save_path, 'show': show}))
         
         # Histograms for numeric data
         for col in numeric_cols[:3]:  # Limit to first 3 numeric columns
             save_path = f"histogram_{col}.png" if save_plots else None
-            self.create_histogram(col, save_path=save_path)
+            charts.append(('create_histogram', (col,), {'save_path': save_path, 'show': show}))
         
         # Scatter plots
         if len(numeric_cols) >= 2:
             # Create scatter plot with first two numeric columns
             color_col = categorical_cols[0] if categorical_cols else None
             save_path = "scatter_plot.png" if save_plots else None
-            self.create_scatter_plot(numeric_cols[0], numeric_cols[1], 
-                                   color_column=color_col, save_path=save_path)
+            charts.append(('create_scatter_plot', (numeric_cols[0], numeric_cols[1]),
+                           {'color_column': color_col, 'save_path': save_path, 'show': show}))
         
         # Correlation heatmap
         if len(numeric_cols) >= 2:
             save_path = "correlation_heatmap.png" if save_plots else None
-            self.create_heatmap(save_path=save_path)
+            charts.append(('create_heatmap', (), {'save_path': save_path, 'show': show}))
+        
+        workers = min(len(charts), os.cpu_count() or 1)
+        if save_plots and not show and workers > 1:
+            # Charts are only written to disk, so render them in parallel worker processes
+            # (each receives the analyzer once) and print their output in the original order
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_chart_worker,
+                                     initargs=(self,)) as executor:
+                futures = [executor.submit(_render_chart, name, args, kwargs)
+                           for name, args, kwargs in charts]
+                for future in futures:
+                    print(future.result(), end='')
+        else:
+            for name, args, kwargs in charts:
+                getattr(self, name)(*args, **kwargs)
         
         # Category analysis
         if numeric_cols and categorical_cols:
-            self.display_category_analysis(numeric_cols[0], categorical_cols[0])
+            self.display_category_analysis(numeric_cols[0], categorical_cols[0], show=show)
         
         # Generate and display insights
         self.display_insights()
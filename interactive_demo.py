@@ -6,6 +6,10 @@ Allows users to explore specific aspects of the data analysis
 from data_analyzer import DataAnalyzer
 import matplotlib.pyplot as plt
 
+def _print_cols(label: str, cols: tuple) -> None:
+    """Print a labelled list of column names"""
+    print(f"{label}: {list(cols)}")
+
 def main():
     """Interactive demo of the data analysis tool"""
     print("🎯 Interactive Data Analysis Demo")
@@ -36,21 +40,19 @@ def main():
             elif choice == '1':
                 analyzer.display_basic_info()
             elif choice == '2':
-                print("\nAvailable numeric columns:", analyzer.df.select_dtypes(include=['number']).columns.tolist())
+                _print_cols("\nAvailable numeric columns", analyzer.numeric_columns)
                 column = input("Enter column name for statistical analysis: ").strip()
                 analyzer.display_statistics(column)
             elif choice == '3':
-                print("\nAvailable categorical columns:", analyzer.df.select_dtypes(include=['object']).columns.tolist())
+                _print_cols("\nAvailable categorical columns", analyzer.categorical_columns)
                 column = input("Enter column name for bar chart: ").strip()
                 analyzer.create_bar_chart(column)
             elif choice == '4':
-                numeric_cols = analyzer.df.select_dtypes(include=['number']).columns.tolist()
-                print(f"\nAvailable numeric columns: {numeric_cols}")
+                _print_cols("\nAvailable numeric columns", analyzer.numeric_columns)
                 x_col = input("Enter X-axis column: ").strip()
                 y_col = input("Enter Y-axis column: ").strip()
                 
-                categorical_cols = analyzer.df.select_dtypes(include=['object']).columns.tolist()
-                print(f"Available categorical columns for color coding: {categorical_cols}")
+                _print_cols("Available categorical columns for color coding", analyzer.categorical_columns)
                 color_col = input("Enter color column (optional, press Enter to skip): ").strip()
                 color_col = color_col if color_col else None
                 
@@ -58,15 +60,12 @@ def main():
             elif choice == '5':
                 analyzer.create_heatmap()
             elif choice == '6':
-                numeric_cols = analyzer.df.select_dtypes(include=['number']).columns.tolist()
-                print(f"\nAvailable numeric columns: {numeric_cols}")
+                _print_cols("\nAvailable numeric columns", analyzer.numeric_columns)
                 column = input("Enter column name for histogram: ").strip()
                 analyzer.create_histogram(column)
             elif choice == '7':
-                numeric_cols = analyzer.df.select_dtypes(include=['number']).columns.tolist()
-                categorical_cols = analyzer.df.select_dtypes(include=['object']).columns.tolist()
-                print(f"\nNumeric columns: {numeric_cols}")
-                print(f"Categorical columns: {categorical_cols}")
+                _print_cols("\nNumeric columns", analyzer.numeric_columns)
+                _print_cols("Categorical columns", analyzer.categorical_columns)
                 
                 numeric_col = input("Enter numeric column to analyze: ").strip()
                 category_col = input("Enter categorical column for grouping: ").strip()